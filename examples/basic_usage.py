@@ -1,6 +1,9 @@
 """Basic usage examples for amplifier-module-style-extraction."""
 
 import asyncio
+import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 from amplifier_module_style_extraction import StyleExtractor
@@ -27,12 +30,11 @@ async def example_serialize_profile():
     profile = await extractor.extract_style(Path("~/writings"))
 
     # Save to file
-    with open("author_style.json", "w") as f:
-        f.write(profile.model_dump_json(indent=2))
+    profile_path = Path("author_style.json")
+    profile_path.write_text(profile.model_dump_json(indent=2), encoding="utf-8")
 
-    # Load later
-    with open("author_style.json") as f:
-        loaded = StyleProfile.model_validate_json(f.read())
+    # Load later (validate straight from bytes, no intermediate str or dict)
+    loaded = StyleProfile.model_validate_json(profile_path.read_bytes())
 
     print(f"Loaded profile: {loaded.tone}")
 
@@ -60,6 +62,21 @@ Topic: The benefits of event-driven architecture
     print(prompt)
 
 
+async def example_large_corpus():
+    """Read a large writing archive with worker processes."""
+    # Worker processes re-import this module, so this must only run under
+    # the `if __name__ == "__main__"` guard below
+    extractor = StyleExtractor(max_samples=100, n_workers=4)
+
+    try:
+        profile = await extractor.extract_style(Path("~/writing_archive"))
+    finally:
+        # Shut down worker processes without blocking the event loop
+        await asyncio.to_thread(extractor.close)
+
+    print(f"Tone across archive: {profile.tone}")
+
+
 async def example_error_handling():
     """Handle extraction failures gracefully."""
     from amplifier_module_style_extraction import StyleExtractionError
@@ -85,7 +102,18 @@ async def example_error_handling():
     print(f"Using profile with tone: {profile.tone}")
 
 
+def configure_logging() -> logging.handlers.QueueListener:
+    """Route module warnings through a queue so async code never blocks on stderr."""
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
+
 if __name__ == "__main__":
+    listener = configure_logging()
+
     print("=== Basic Extraction ===")
     asyncio.run(example_basic_extraction())
 
@@ -95,5 +123,10 @@ if __name__ == "__main__":
     print("\n=== Use in Prompts ===")
     asyncio.run(example_use_in_prompts())
 
+    print("\n=== Large Corpus ===")
+    asyncio.run(example_large_corpus())
+
     print("\n=== Error Handling ===")
     asyncio.run(example_error_handling())
+
+    listener.stop()
@@ -3,6 +3,7 @@
 from .extractor import StyleExtractor
 from .models import StyleExtractionError
 from .models import StyleProfile
+from .models import StyleProfileView
 
 __version__ = "0.1.0"
-__all__ = ["StyleExtractor", "StyleProfile", "StyleExtractionError"]
+__all__ = ["StyleExtractor", "StyleProfile", "StyleExtractionError", "StyleProfileView"]
@@ -3,14 +3,177 @@
 Analyzes writing samples to extract author's unique style patterns.
 """
 
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from pydantic_ai import Agent
+from pydantic_ai import NativeOutput
 
 from .models import StyleExtractionError
 from .models import StyleProfile
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent LLM calls per extractor, to stay within provider rate limits
+_MAX_CONCURRENT_ANALYSES = 8
+
+# Style analysis prompt; {samples} is the only interpolated field
+_ANALYSIS_PROMPT = """Analyze these writing samples to extract the author's style:
+
+{samples}
+
+Extract:
+1. Overall tone (formal/casual/technical/conversational)
+2. Vocabulary complexity level (simple/moderate/advanced)
+3. Typical sentence structure patterns
+4. Paragraph length preference (short/medium/long)
+5. Common phrases or expressions (list)
+6. Recurring writing patterns (list)
+7. Voice preference (active/passive/mixed)
+8. 3-5 example sentences that best capture the style (list)
+
+Return a structured response with these fields."""
+
+# Minimum seconds between partial profiles delivered while streaming
+_STREAM_DEBOUNCE_SECONDS = 0.05
+
+# Process pools only pay off once there are enough files to amortize worker startup
+_PROCESS_POOL_MIN_FILES = 32
+
+# Below this many characters of samples, an LLM call cannot produce a meaningful profile
+_MIN_SAMPLE_CHARS = 500
+
+# YAML front matter block at the very start of a markdown file (newlines already normalized)
+_FRONT_MATTER = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+
+# Extra characters that may be read past the sample budget to find the end of
+# front matter, so it can be removed before truncation
+_FRONT_MATTER_ALLOWANCE_CHARS = 20_000
+
+# Leading and trailing characters compared when detecting near-duplicate samples
+_DEDUP_EDGE_CHARS = 200
+
+
+def _iter_markdown_files(root: Path, limit: int) -> Iterator[Path]:
+    """Yield markdown files under ``root``, stopping after ``limit`` files.
+
+    Traversal is lazy, so large directory trees are only walked as far as
+    needed to collect ``limit`` files.
+
+    Args:
+        root: Directory to search recursively
+        limit: Maximum number of files to yield
+
+    Yields:
+        Paths of markdown files, in sorted order within each directory
+    """
+    if limit <= 0:
+        return
+    count = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith(".md"):
+                yield Path(dirpath) / name
+                count += 1
+                if count >= limit:
+                    return
+
+
+def _dedup_samples(samples: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Drop samples whose opening and closing text duplicate an earlier sample.
+
+    Comparing both ends keeps distinct posts that merely share a header
+    (banner, byline, standard intro).
+
+    Args:
+        samples: (name, content) pairs in priority order
+
+    Returns:
+        Samples with near-duplicates removed, order preserved
+    """
+    seen: set[bytes] = set()
+    unique = []
+    for name, content in samples:
+        edges = content[:_DEDUP_EDGE_CHARS] + content[-_DEDUP_EDGE_CHARS:]
+        key = hashlib.blake2b(edges.encode("utf-8"), digest_size=8).digest()
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append((name, content))
+    return unique
+
+
+def _read_sample(path: Path, max_chars: int) -> str:
+    """Read one writing sample, skipping any leading YAML front matter.
+
+    Reads only ``max_chars`` characters unless the file opens with front
+    matter, in which case the read is extended (up to an allowance) to find
+    its end so the front matter does not consume the sample budget. Text
+    mode normalizes newlines to ``\\n`` as with ``Path.read_text``, and
+    invalid bytes become U+FFFD instead of raising.
+
+    Blocking; run in a worker thread or process so the event loop stays
+    responsive. Module-level so it can be pickled for process pools.
+
+    Args:
+        path: Markdown file to read
+        max_chars: Maximum number of characters to return
+
+    Returns:
+        Up to ``max_chars`` characters of sample text, after front matter
+    """
+    with path.open(encoding="utf-8", errors="replace", newline=None) as f:
+        text = f.read(max_chars)
+        if not text.startswith("---\n"):
+            return text
+
+        # Extend the read until the closing delimiter, giving up at the allowance
+        limit = max_chars + _FRONT_MATTER_ALLOWANCE_CHARS
+        match = _FRONT_MATTER.match(text)
+        while match is None and len(text) < limit:
+            chunk = f.read(min(max_chars, limit - len(text)))
+            if not chunk:
+                break
+            text += chunk
+            match = _FRONT_MATTER.match(text)
+        if match is None:
+            return text[:max_chars]
+
+        body = text[match.end() :]
+        if len(body) < max_chars:
+            body += f.read(max_chars - len(body))
+        return body[:max_chars]
+
+
+@cache
+def _style_agent() -> Agent[None, StyleProfile]:
+    """Build the style analysis agent once per process.
+
+    Building the agent derives StyleProfile's JSON schema, so sharing one
+    agent across extractors avoids regenerating it.
+
+    Returns:
+        Agent configured for structured style extraction
+    """
+    # Native structured output: the provider enforces the schema in a single call,
+    # instead of a tool call validated (and possibly retried) on our side
+    return Agent(
+        "openai:gpt-4o",
+        output_type=NativeOutput(StyleProfile, strict=True),
+        system_prompt="You are an expert writing style analyst. Extract detailed style characteristics from text samples.",
+    )
+
 
 class StyleExtractor:
     """Extract author style from writing samples.
@@ -25,24 +188,50 @@ class StyleExtractor:
         'conversational'
     """
 
-    def __init__(self, coordinator: Any | None = None) -> None:
+    def __init__(self, coordinator: Any | None = None, max_samples: int = 5, n_workers: int = 0) -> None:
         """Initialize style extractor.
 
         Args:
             coordinator: Optional capability coordinator for registration
+            max_samples: Maximum number of sample files read per directory
+            n_workers: Worker processes for reading and cleaning samples. Used only
+                       when greater than 1 and more than 32 files are selected;
+                       otherwise samples are read in threads. Callers using this
+                       must guard their entry point with ``if __name__ == "__main__"``
+                       and call close() when done with the extractor.
         """
         self.profile: StyleProfile | None = None
+        self.max_samples = max_samples
+        self.n_workers = n_workers
+        self._analysis_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
 
         # Register capability if coordinator provided
         if coordinator:
             coordinator.register_capability("style_extraction.analyzer", self)
 
-    async def extract_style(self, samples_dir: Path) -> StyleProfile:
+    def close(self) -> None:
+        """Shut down the worker process pool, if one was started.
+
+        Blocks until the workers exit; from async code, run it with
+        ``await asyncio.to_thread(extractor.close)``. The extractor stays
+        usable and starts a new pool if needed.
+        """
+        if self._process_pool is not None:
+            pool, self._process_pool = self._process_pool, None
+            pool.shutdown()
+
+    async def extract_style(
+        self, samples_dir: Path, on_partial: Callable[[StyleProfile], None] | None = None
+    ) -> StyleProfile:
         """Extract style profile from writing samples.
 
         Args:
             samples_dir: Directory containing markdown writing samples.
                         Path will be expanded (~ and vars resolved).
+            on_partial: Optional callback receiving partial profiles as the LLM
+                        response streams in. Early fields such as tone are usable
+                        before the list fields have finished arriving.
 
         Returns:
             Extracted style profile with tone, vocabulary, patterns, etc.
@@ -55,44 +244,145 @@ class StyleExtractor:
             >>> profile = await extractor.extract_style(Path("~/blog_posts"))
             >>> assert profile.tone in ["conversational", "formal", "technical"]
         """
+        combined_samples = await self._load_samples(samples_dir)
+
+        # Extract style with AI
+        profile = await self._analyze_with_ai(combined_samples, on_partial)
+
+        # Store profile and register if we have coordinator
+        self.profile = profile
+
+        return profile
+
+    async def extract_styles(self, samples_dirs: list[Path]) -> list[StyleProfile]:
+        """Extract style profiles for several sample directories concurrently.
+
+        Samples are loaded and analyzed for all directories at once, so LLM
+        round-trips overlap instead of running back to back. Unlike
+        extract_style, the results are not stored on the extractor.
+
+        Args:
+            samples_dirs: Directories containing markdown writing samples,
+                          typically one per author
+
+        Returns:
+            Extracted style profiles, in the same order as samples_dirs
+
+        Raises:
+            StyleExtractionError: If any directory has no readable samples
+
+        Example:
+            >>> extractor = StyleExtractor()
+            >>> profiles = await extractor.extract_styles([Path("~/alice"), Path("~/bob")])
+            >>> assert len(profiles) == 2
+        """
+        combined = await asyncio.gather(*(self._load_samples(d) for d in samples_dirs))
+        return list(await asyncio.gather(*(self._analyze_with_ai(s) for s in combined)))
+
+    async def _load_samples(self, samples_dir: Path) -> str:
+        """Read writing samples from a directory into a single analysis input.
+
+        Args:
+            samples_dir: Directory containing markdown writing samples.
+                        Path will be expanded (~ and vars resolved).
+
+        Returns:
+            Combined samples, each prefixed with its file name
+
+        Raises:
+            StyleExtractionError: If no samples found or none could be read
+        """
         # Expand path (handle ~ and environment variables)
         samples_dir = samples_dir.expanduser()
 
-        # Find all markdown files recursively
-        files = list(samples_dir.glob("**/*.md"))
+        # Limit samples to prevent context overflow
+        max_samples = self.max_samples
+        max_chars_per_sample = 3000
+
+        # Find markdown files recursively (off the event loop), stopping at the limit
+        files = await asyncio.to_thread(lambda: list(_iter_markdown_files(samples_dir, max_samples)))
         if not files:
             raise StyleExtractionError(f"No markdown files found in {samples_dir}")
 
-        # Read samples (limit to prevent context overflow)
-        samples = []
-        max_samples = 5
-        max_chars_per_sample = 3000
+        # Read and clean samples concurrently, in processes for large sample sets
+        if self.n_workers > 1 and len(files) > _PROCESS_POOL_MIN_FILES:
+            loop = asyncio.get_running_loop()
+            pool = self._get_process_pool()
+            contents = await asyncio.gather(
+                *(loop.run_in_executor(pool, _read_sample, file, max_chars_per_sample) for file in files),
+                return_exceptions=True,
+            )
+        else:
+            contents = await asyncio.gather(
+                *(asyncio.to_thread(_read_sample, file, max_chars_per_sample) for file in files),
+                return_exceptions=True,
+            )
 
-        for file in files[:max_samples]:
-            try:
-                content = file.read_text(encoding="utf-8")[:max_chars_per_sample]
-                samples.append(f"=== {file.name} ===\n{content}")
-            except Exception as e:
+        samples = []
+        for file, content in zip(files, contents, strict=True):
+            if isinstance(content, OSError):
                 # Log warning but continue with other samples
-                print(f"Warning: Could not read {file}: {e}")
+                logger.warning("Could not read %s: %s", file, content)
+                continue
+            if isinstance(content, BaseException):
+                raise content
+            samples.append((file.name, content))
 
         if not samples:
             raise StyleExtractionError("Could not read any writing samples")
 
-        # Extract style with AI
-        combined_samples = "\n\n".join(samples)
-        profile = await self._analyze_with_ai(combined_samples)
+        # Repeated boilerplate only costs input tokens
+        samples = _dedup_samples(samples)
 
-        # Store profile and register if we have coordinator
-        self.profile = profile
+        return "\n\n".join(f"=== {name} ===\n{content}" for name, content in samples)
 
-        return profile
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the extractor's worker process pool, starting it on first use.
+
+        One pool is shared by all directories, so extract_styles never starts
+        more than n_workers processes. Workers use the spawn start method on
+        every platform, which is why callers need a ``__main__`` guard.
+
+        Returns:
+            Process pool with n_workers workers
+        """
+        if self._process_pool is None:
+            # Spawn rather than fork: the pool starts inside a running event loop,
+            # after worker threads exist, and forking a threaded process can deadlock
+            self._process_pool = ProcessPoolExecutor(self.n_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._process_pool
+
+    def _get_agent(self) -> Agent[None, StyleProfile]:
+        """Return the PydanticAI agent used for extraction.
+
+        Returns:
+            Agent configured for structured style extraction
+        """
+        return _style_agent()
+
+    def _get_analysis_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent LLM calls on the running loop.
+
+        A semaphore is bound to the event loop it is first used on, so a new
+        one is created whenever the extractor is used from a different loop.
 
-    async def _analyze_with_ai(self, samples: str) -> StyleProfile:
+        Returns:
+            Semaphore for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._analysis_slots is None or self._analysis_slots[0] is not loop:
+            self._analysis_slots = (loop, asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES))
+        return self._analysis_slots[1]
+
+    async def _analyze_with_ai(
+        self, samples: str, on_partial: Callable[[StyleProfile], None] | None = None
+    ) -> StyleProfile:
         """Analyze samples with AI to extract style.
 
         Args:
             samples: Combined writing samples
+            on_partial: Optional callback for partial profiles; when given, the
+                        response is streamed instead of awaited in full
 
         Returns:
             Extracted style profile
@@ -100,37 +390,39 @@ class StyleExtractor:
         Raises:
             StyleExtractionError: If analysis fails
         """
-        prompt = f"""Analyze these writing samples to extract the author's style:
-
-{samples}
+        # Skip the LLM round-trip when there is too little text to analyze
+        if len(samples) < _MIN_SAMPLE_CHARS:
+            logger.warning("Only %d characters of samples, using default style profile", len(samples))
+            return self._default_profile()
 
-Extract:
-1. Overall tone (formal/casual/technical/conversational)
-2. Vocabulary complexity level (simple/moderate/advanced)
-3. Typical sentence structure patterns
-4. Paragraph length preference (short/medium/long)
-5. Common phrases or expressions (list)
-6. Recurring writing patterns (list)
-7. Voice preference (active/passive/mixed)
-8. 3-5 example sentences that best capture the style (list)
+        prompt = _ANALYSIS_PROMPT.format(samples=samples)
 
-Return a structured response with these fields."""
+        # Build the agent outside the fallback so configuration errors reach the caller
+        agent = self._get_agent()
 
-        # Create PydanticAI agent for structured extraction
-        agent: Agent[None, StyleProfile] = Agent(
-            "openai:gpt-4o",
-            output_type=StyleProfile,
-            system_prompt="You are an expert writing style analyst. Extract detailed style characteristics from text samples.",
-        )
+        # Errors raised by the caller's callback are not LLM failures; let them propagate
+        callback_error: Exception | None = None
 
-        try:
-            result = await agent.run(prompt)
-            return result.output
-        except Exception as e:
-            # Fall back to default profile on error
-            print(f"Warning: Style extraction failed: {e}")
-            print("Using default style profile")
-            return self._default_profile()
+        async with self._get_analysis_slots():
+            try:
+                if on_partial is None:
+                    result = await agent.run(prompt)
+                    return result.output
+
+                async with agent.run_stream(prompt) as streamed:
+                    async for partial in streamed.stream_output(debounce_by=_STREAM_DEBOUNCE_SECONDS):
+                        try:
+                            on_partial(partial)
+                        except Exception as e:
+                            callback_error = e
+                            raise
+                    return await streamed.get_output()
+            except Exception as e:
+                if e is callback_error:
+                    raise
+                # Fall back to default profile on error
+                logger.warning("Style extraction failed, using default style profile: %s", e)
+                return self._default_profile()
 
     def _default_profile(self) -> StyleProfile:
         """Return default style profile when extraction fails.
@@ -1,13 +1,107 @@
 """Data models for style extraction operations."""
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 from pydantic import BaseModel
 from pydantic import Field
 
+# Fixed guidance lines rendered from the scalar profile fields
+_HEADER_TEMPLATE = (
+    "Write with a {tone} tone.\n"
+    "Use {vocabulary_level} vocabulary level.\n"
+    "Structure sentences: {sentence_structure}.\n"
+    "Prefer {paragraph_length} paragraphs.\n"
+    "Use {voice} voice."
+)
+
+
+@lru_cache(maxsize=128)
+def _render_prompt_text(
+    tone: str,
+    vocabulary_level: str,
+    sentence_structure: str,
+    paragraph_length: str,
+    voice: str,
+    common_phrases: tuple[str, ...],
+    writing_patterns: tuple[str, ...],
+    examples: tuple[str, ...],
+) -> str:
+    """Render style guidance text, memoized on the field values.
+
+    Keyed on values rather than the profile instance, so a mutated profile
+    never returns stale text.
+    """
+    parts = [
+        _HEADER_TEMPLATE.format(
+            tone=tone,
+            vocabulary_level=vocabulary_level,
+            sentence_structure=sentence_structure,
+            paragraph_length=paragraph_length,
+            voice=voice,
+        )
+    ]
+
+    if common_phrases:
+        phrases = ", ".join(f'"{p}"' for p in common_phrases)
+        parts.append(f"Common phrases include: {phrases}.")
+
+    if writing_patterns:
+        patterns = ", ".join(writing_patterns)
+        parts.append(f"Follow these patterns: {patterns}.")
+
+    if examples:
+        parts.append("Example style:")
+        for example in examples:
+            parts.append(f'  - "{example}"')
+
+    return "\n".join(parts)
+
 
 class StyleExtractionError(Exception):
     """Raised when style extraction fails."""
 
 
+@dataclass(frozen=True, slots=True)
+class StyleProfileView:
+    """Immutable, slotted snapshot of a StyleProfile for read-heavy code.
+
+    StyleProfile is a Pydantic model so that LLM output can be validated;
+    code that only reads fields in tight loops can convert once with
+    StyleProfile.to_view() and reuse the view. List fields become tuples.
+
+    Example:
+        >>> view = profile.to_view()
+        >>> assert view.tone == profile.tone
+    """
+
+    tone: str
+    vocabulary_level: str
+    sentence_structure: str
+    paragraph_length: str
+    voice: str
+    common_phrases: tuple[str, ...] = ()
+    writing_patterns: tuple[str, ...] = ()
+    examples: tuple[str, ...] = ()
+
+    def to_prompt_text(self) -> str:
+        """Convert style view to natural language for LLM prompts.
+
+        Returns:
+            Same text as StyleProfile.to_prompt_text() for the source profile
+        """
+        return _render_prompt_text(
+            self.tone,
+            self.vocabulary_level,
+            self.sentence_structure,
+            self.paragraph_length,
+            self.voice,
+            self.common_phrases[:5],
+            self.writing_patterns,
+            self.examples[:3],
+        )
+
+
 class StyleProfile(BaseModel):
     """Author style profile extracted from writing samples.
 
@@ -75,25 +169,32 @@ class StyleProfile(BaseModel):
             >>> assert "moderate vocabulary" in prompt_text
             >>> assert "short and direct" in prompt_text
         """
-        parts = [
-            f"Write with a {self.tone} tone.",
-            f"Use {self.vocabulary_level} vocabulary level.",
-            f"Structure sentences: {self.sentence_structure}.",
-            f"Prefer {self.paragraph_length} paragraphs.",
-            f"Use {self.voice} voice.",
-        ]
-
-        if self.common_phrases:
-            phrases = ", ".join(f'"{p}"' for p in self.common_phrases[:5])
-            parts.append(f"Common phrases include: {phrases}.")
-
-        if self.writing_patterns:
-            patterns = ", ".join(self.writing_patterns)
-            parts.append(f"Follow these patterns: {patterns}.")
-
-        if self.examples:
-            parts.append("Example style:")
-            for example in self.examples[:3]:
-                parts.append(f'  - "{example}"')
-
-        return "\n".join(parts)
+        return _render_prompt_text(
+            self.tone,
+            self.vocabulary_level,
+            self.sentence_structure,
+            self.paragraph_length,
+            self.voice,
+            tuple(self.common_phrases[:5]),
+            tuple(self.writing_patterns),
+            tuple(self.examples[:3]),
+        )
+
+    def to_view(self) -> StyleProfileView:
+        """Create an immutable, slotted snapshot of this profile.
+
+        Later changes to the profile are not reflected in the view.
+
+        Returns:
+            StyleProfileView with the same field values
+        """
+        return StyleProfileView(
+            tone=self.tone,
+            vocabulary_level=self.vocabulary_level,
+            sentence_structure=self.sentence_structure,
+            paragraph_length=self.paragraph_length,
+            voice=self.voice,
+            common_phrases=tuple(self.common_phrases),
+            writing_patterns=tuple(self.writing_patterns),
+            examples=tuple(self.examples),
+        )
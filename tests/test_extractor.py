@@ -0,0 +1,419 @@
+"""Tests for style extractor sample loading."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from amplifier_module_style_extraction.extractor import StyleExtractor
+from amplifier_module_style_extraction.extractor import _read_sample
+from amplifier_module_style_extraction.models import StyleExtractionError
+from amplifier_module_style_extraction.models import StyleProfile
+
+
+@dataclass
+class FakeResult:
+    """Stand-in for a PydanticAI run result."""
+
+    output: StyleProfile
+
+
+class FakeStream:
+    """Stand-in for a PydanticAI streamed run that yields fixed profiles."""
+
+    def __init__(self, outputs: list[StyleProfile]) -> None:
+        self._outputs = outputs
+
+    async def stream_output(self, debounce_by: float) -> AsyncIterator[StyleProfile]:
+        for output in self._outputs:
+            yield output
+
+    async def get_output(self) -> StyleProfile:
+        return self._outputs[-1]
+
+
+class FakeAgent:
+    """Stand-in for the PydanticAI agent that records prompts and returns fixed profiles."""
+
+    def __init__(self, *outputs: StyleProfile, delay: float = 0.0) -> None:
+        self.outputs = list(outputs)
+        self.prompts: list[str] = []
+        self._delay = delay
+
+    async def run(self, prompt: str) -> FakeResult:
+        self.prompts.append(prompt)
+        await asyncio.sleep(self._delay)
+        return FakeResult(self.outputs[-1])
+
+    @asynccontextmanager
+    async def run_stream(self, prompt: str) -> AsyncIterator[FakeStream]:
+        self.prompts.append(prompt)
+        yield FakeStream(self.outputs)
+
+
+@pytest.fixture
+def captured() -> list[str]:
+    """Combined samples passed to AI analysis by the extractor fixture."""
+    return []
+
+
+@pytest.fixture
+def extractor(monkeypatch: pytest.MonkeyPatch, captured: list[str]) -> StyleExtractor:
+    """StyleExtractor whose AI analysis records the combined samples instead of calling a model."""
+    extractor = StyleExtractor()
+
+    async def fake_analyze(samples: str, on_partial=None) -> StyleProfile:
+        captured.append(samples)
+        return extractor._default_profile()
+
+    monkeypatch.setattr(extractor, "_analyze_with_ai", fake_analyze)
+    return extractor
+
+
+async def test_extract_style_reads_all_samples(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that every markdown sample ends up in the combined samples."""
+    (tmp_path / "a.md").write_text("First post.", encoding="utf-8")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.md").write_text("Second post.", encoding="utf-8")
+    (tmp_path / "ignored.txt").write_text("Not markdown.", encoding="utf-8")
+
+    profile = await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert "=== a.md ===\nFirst post." in combined
+    assert "=== b.md ===\nSecond post." in combined
+    assert "Not markdown." not in combined
+    assert extractor.profile is profile
+
+
+async def test_extract_style_truncates_samples(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that each sample is limited to 3000 characters."""
+    (tmp_path / "long.md").write_text("x" * 5000, encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined.count("x") == 3000
+
+
+async def test_extract_style_limits_sample_count(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that at most 5 samples are sent for analysis."""
+    for i in range(8):
+        (tmp_path / f"post{i}.md").write_text(f"Post {i}.", encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined.count("=== post") == 5
+
+
+async def test_extract_style_no_samples(tmp_path: Path, extractor: StyleExtractor):
+    """Test that an empty directory raises StyleExtractionError."""
+    with pytest.raises(StyleExtractionError):
+        await extractor.extract_style(tmp_path)
+
+
+async def test_extract_style_truncates_multibyte_samples(
+    tmp_path: Path, extractor: StyleExtractor, captured: list[str]
+):
+    """Test that truncation counts characters, not bytes, for non-ASCII text."""
+    (tmp_path / "unicode.md").write_text("é" * 5000, encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined.count("é") == 3000
+
+
+async def test_extract_style_sample_order_is_deterministic(
+    tmp_path: Path, extractor: StyleExtractor, captured: list[str]
+):
+    """Test that top-level samples are selected in sorted order before subdirectories."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.md").write_text("Nested.", encoding="utf-8")
+    for name in ["e.md", "c.md", "a.md", "d.md", "b.md", "f.md"]:
+        (tmp_path / name).write_text(name, encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert [line for line in combined.splitlines() if line.startswith("===")] == [
+        f"=== {c}.md ===" for c in "abcde"
+    ]
+
+
+async def test_extract_styles_returns_profile_per_directory(
+    tmp_path: Path, extractor: StyleExtractor, captured: list[str]
+):
+    """Test that extract_styles analyzes each directory separately, in order."""
+    for author in ["alice", "bob"]:
+        (tmp_path / author).mkdir()
+        (tmp_path / author / "post.md").write_text(f"Written by {author}.", encoding="utf-8")
+
+    profiles = await extractor.extract_styles([tmp_path / "alice", tmp_path / "bob"])
+
+    assert len(profiles) == 2
+    assert sorted(captured) == ["=== post.md ===\nWritten by alice.", "=== post.md ===\nWritten by bob."]
+    assert extractor.profile is None
+
+
+def test_agent_shared_across_extractors(monkeypatch: pytest.MonkeyPatch):
+    """Test that the analysis agent (and its output schema) is built once and reused."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    assert StyleExtractor()._get_agent() is StyleExtractor()._get_agent()
+
+
+async def test_extract_style_strips_front_matter(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that YAML front matter is removed before analysis."""
+    (tmp_path / "post.md").write_text("---\ntitle: Hello\ntags: [a, b]\n---\nActual prose.", encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined == "=== post.md ===\nActual prose."
+
+
+async def test_extract_style_drops_duplicate_samples(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that repeated samples are only sent once, but posts sharing a header are kept."""
+    boilerplate = "Subscribe to my newsletter! " * 10
+    (tmp_path / "a.md").write_text(boilerplate + "First ending.", encoding="utf-8")
+    (tmp_path / "b.md").write_text(boilerplate + "Second ending.", encoding="utf-8")
+    (tmp_path / "c.md").write_text(boilerplate + "First ending.", encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert "=== a.md ===" in combined
+    assert "=== b.md ===" in combined
+    assert "=== c.md ===" not in combined
+
+
+async def test_analyze_with_ai_skips_tiny_samples(monkeypatch: pytest.MonkeyPatch):
+    """Test that too-short samples return the default profile without calling the LLM."""
+    extractor = StyleExtractor()
+
+    def fail_get_agent():
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(extractor, "_get_agent", fail_get_agent)
+
+    profile = await extractor._analyze_with_ai("=== post.md ===\nToo short.")
+
+    assert profile == extractor._default_profile()
+
+
+async def test_analyze_with_ai_prompt_keeps_braces(monkeypatch: pytest.MonkeyPatch):
+    """Test that braces in samples are passed through to the prompt verbatim."""
+    extractor = StyleExtractor()
+    agent = FakeAgent(extractor._default_profile())
+    monkeypatch.setattr(extractor, "_get_agent", lambda: agent)
+    samples = "Code like `{key: value}` and {samples} appears in posts. " * 20
+
+    await extractor._analyze_with_ai(samples)
+
+    assert samples in agent.prompts[0]
+    assert agent.prompts[0].startswith("Analyze these writing samples")
+
+
+async def test_extract_style_replaces_invalid_utf8(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that files with invalid UTF-8 are read with replacement characters."""
+    (tmp_path / "latin1.md").write_bytes("Café culture.".encode("latin-1"))
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert "Caf� culture." in combined
+
+
+async def test_extract_style_skips_unreadable_files(
+    tmp_path: Path, extractor: StyleExtractor, captured: list[str], caplog: pytest.LogCaptureFixture
+):
+    """Test that unreadable files are logged and skipped."""
+    (tmp_path / "a.md").write_text("Readable.", encoding="utf-8")
+    (tmp_path / "broken.md").symlink_to(tmp_path / "missing.md")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined == "=== a.md ===\nReadable."
+    assert "Could not read" in caplog.text
+
+
+async def test_extract_style_with_process_pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that large sample sets read through a process pool give the same result as threads."""
+    for i in range(40):
+        (tmp_path / f"post{i:02d}.md").write_text(f"---\ntitle: {i}\n---\nPost number {i}.", encoding="utf-8")
+
+    results = []
+    for n_workers in (0, 2):
+        extractor = StyleExtractor(max_samples=40, n_workers=n_workers)
+
+        async def fake_analyze(samples: str, on_partial=None) -> StyleProfile:
+            results.append(samples)
+            return extractor._default_profile()
+
+        monkeypatch.setattr(extractor, "_analyze_with_ai", fake_analyze)
+        await extractor.extract_style(tmp_path)
+        assert (extractor._process_pool is not None) == (n_workers > 1)
+        extractor.close()
+
+    assert results[0] == results[1]
+    assert results[1].count("=== post") == 40
+    assert "title:" not in results[1]
+
+
+async def test_analyze_with_ai_streams_partial_profiles(monkeypatch: pytest.MonkeyPatch):
+    """Test that partial profiles reach on_partial and the final profile is returned."""
+    extractor = StyleExtractor()
+    partial = extractor._default_profile().model_copy(update={"examples": []})
+    final = extractor._default_profile()
+    monkeypatch.setattr(extractor, "_get_agent", lambda: FakeAgent(partial, final))
+    received = []
+
+    profile = await extractor._analyze_with_ai("x" * 1000, on_partial=received.append)
+
+    assert received == [partial, final]
+    assert profile is final
+
+
+async def test_analyze_with_ai_agent_errors_propagate(monkeypatch: pytest.MonkeyPatch):
+    """Test that agent configuration errors are raised, not replaced by the default profile."""
+    extractor = StyleExtractor()
+
+    def failing_get_agent():
+        raise RuntimeError("missing API key")
+
+    monkeypatch.setattr(extractor, "_get_agent", failing_get_agent)
+
+    with pytest.raises(RuntimeError, match="missing API key"):
+        await extractor._analyze_with_ai("x" * 1000)
+
+
+def test_analyze_with_ai_reusable_across_event_loops(monkeypatch: pytest.MonkeyPatch):
+    """Test that a long-lived extractor limits concurrency correctly under a new event loop."""
+    extractor = StyleExtractor()
+    extracted = extractor._default_profile().model_copy(update={"tone": "extracted"})
+    monkeypatch.setattr(extractor, "_get_agent", lambda: FakeAgent(extracted, delay=0.01))
+
+    async def analyze_many() -> list[StyleProfile]:
+        return list(await asyncio.gather(*(extractor._analyze_with_ai("x" * 1000) for _ in range(10))))
+
+    for _ in range(2):
+        profiles = asyncio.run(analyze_many())
+        assert all(profile.tone == "extracted" for profile in profiles)
+
+
+async def test_analyze_with_ai_partial_callback_errors_propagate(monkeypatch: pytest.MonkeyPatch):
+    """Test that exceptions from on_partial reach the caller instead of the default fallback."""
+    extractor = StyleExtractor()
+    monkeypatch.setattr(extractor, "_get_agent", lambda: FakeAgent(extractor._default_profile()))
+
+    def broken_callback(profile: StyleProfile) -> None:
+        raise KeyError("caller bug")
+
+    with pytest.raises(KeyError, match="caller bug"):
+        await extractor._analyze_with_ai("x" * 1000, on_partial=broken_callback)
+
+
+async def test_extract_styles_shares_one_process_pool(
+    tmp_path: Path, extractor: StyleExtractor, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that all directories reuse one process pool until close() is called."""
+    extractor.max_samples = 40
+    extractor.n_workers = 2
+    for author in ["alice", "bob"]:
+        (tmp_path / author).mkdir()
+        for i in range(40):
+            (tmp_path / author / f"post{i:02d}.md").write_text(f"{author} post {i}.", encoding="utf-8")
+
+    started = []
+    original_get_pool = extractor._get_process_pool
+
+    def tracking_get_pool():
+        pool = original_get_pool()
+        started.append(pool)
+        return pool
+
+    monkeypatch.setattr(extractor, "_get_process_pool", tracking_get_pool)
+    try:
+        await extractor.extract_styles([tmp_path / "alice", tmp_path / "bob"])
+    finally:
+        await asyncio.to_thread(extractor.close)
+
+    assert len(started) == 2
+    assert started[0] is started[1]
+    assert started[0]._mp_context.get_start_method() == "spawn"
+    assert extractor._process_pool is None
+
+
+async def test_extract_style_normalizes_newlines(tmp_path: Path, extractor: StyleExtractor, captured: list[str]):
+    """Test that CRLF and CR line endings are read as plain newlines."""
+    (tmp_path / "windows.md").write_bytes(b"line1\r\nline2\rline3\r\n")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined == "=== windows.md ===\nline1\nline2\nline3\n"
+
+
+async def test_extract_style_strips_long_front_matter_before_truncating(
+    tmp_path: Path, extractor: StyleExtractor, captured: list[str]
+):
+    """Test that front matter longer than the sample budget is removed and does not consume it."""
+    front_matter = "---\n" + "".join(f"key{i}: {'v' * 40}\n" for i in range(100)) + "---\n"
+    assert len(front_matter) > 3000
+    (tmp_path / "post.md").write_text(front_matter + "p" * 5000, encoding="utf-8")
+
+    await extractor.extract_style(tmp_path)
+
+    combined = captured[0]
+    assert combined == "=== post.md ===\n" + "p" * 3000
+
+
+@pytest.fixture
+def chars_read(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Record the number of characters returned by each read of an opened file."""
+    reads: list[int] = []
+    original_open = Path.open
+
+    class CountingFile:
+        def __init__(self, f):
+            self._f = f
+
+        def read(self, size: int = -1) -> str:
+            text = self._f.read(size)
+            reads.append(len(text))
+            return text
+
+        def __getattr__(self, name: str):
+            return getattr(self._f, name)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self._f.close()
+
+    monkeypatch.setattr(Path, "open", lambda self, *args, **kwargs: CountingFile(original_open(self, *args, **kwargs)))
+    return reads
+
+
+def test_read_sample_reads_only_budget_without_front_matter(tmp_path: Path, chars_read: list[int]):
+    """Test that a large file without front matter is read only up to the sample budget."""
+    path = tmp_path / "book.md"
+    path.write_text("p" * 100_000, encoding="utf-8")
+
+    assert _read_sample(path, 3000) == "p" * 3000
+    assert sum(chars_read) == 3000
+
+
+def test_read_sample_stops_at_allowance_for_unclosed_front_matter(tmp_path: Path, chars_read: list[int]):
+    """Test that an unterminated front matter block does not extend the read past the allowance."""
+    path = tmp_path / "broken.md"
+    path.write_text("---\n" + "p" * 100_000, encoding="utf-8")
+
+    assert _read_sample(path, 3000) == ("---\n" + "p" * 100_000)[:3000]
+    assert sum(chars_read) == 23_000
@@ -1,8 +1,12 @@
 """Tests for style extraction models."""
 
+import dataclasses
+
 import pytest
 from amplifier_module_style_extraction.models import StyleProfile
+from amplifier_module_style_extraction.models import StyleProfileView
 from pydantic import ValidationError
+from pydantic_core import SchemaSerializer
 
 
 def test_style_profile_creation():
@@ -205,3 +209,102 @@ def test_style_profile_dict_serialization():
 
     assert loaded.tone == profile.tone
     assert loaded.vocabulary_level == profile.vocabulary_level
+
+
+def test_style_profile_schema_built_at_import():
+    """Test that validation and serialization schemas are compiled eagerly, not on first use."""
+    assert StyleProfile.__pydantic_complete__
+    assert isinstance(StyleProfile.__pydantic_serializer__, SchemaSerializer)
+    assert not StyleProfile.model_config.get("defer_build", False)
+
+
+def test_style_profile_to_prompt_text_full_output():
+    """Test the exact prompt text layout for a fully populated profile."""
+    profile = StyleProfile(
+        tone="conversational",
+        vocabulary_level="moderate",
+        sentence_structure="short and direct",
+        paragraph_length="medium",
+        voice="active",
+        common_phrases=["in practice", "for example"],
+        writing_patterns=["problem-solution", "example-driven"],
+        examples=["Clear communication matters.", "Let's dive in."],
+    )
+
+    assert profile.to_prompt_text() == (
+        "Write with a conversational tone.\n"
+        "Use moderate vocabulary level.\n"
+        "Structure sentences: short and direct.\n"
+        "Prefer medium paragraphs.\n"
+        "Use active voice.\n"
+        'Common phrases include: "in practice", "for example".\n'
+        "Follow these patterns: problem-solution, example-driven.\n"
+        "Example style:\n"
+        '  - "Clear communication matters."\n'
+        '  - "Let\'s dive in."'
+    )
+
+
+def test_style_profile_to_prompt_text_reflects_mutation():
+    """Test that cached prompt text is not reused after the profile changes."""
+    profile = StyleProfile(
+        tone="conversational",
+        vocabulary_level="moderate",
+        sentence_structure="varied",
+        paragraph_length="medium",
+        voice="active",
+        common_phrases=["in practice"],
+    )
+
+    assert profile.to_prompt_text() == profile.to_prompt_text()
+    assert "in practice" in profile.to_prompt_text()
+
+    profile.tone = "formal"
+    profile.common_phrases.append("to be sure")
+    prompt_text = profile.to_prompt_text()
+
+    assert "formal tone" in prompt_text
+    assert "to be sure" in prompt_text
+
+
+def test_style_profile_validate_json_bytes():
+    """Test that profiles round-trip through raw JSON bytes."""
+    profile = StyleProfile(
+        tone="conversational",
+        vocabulary_level="moderate",
+        sentence_structure="short and direct",
+        paragraph_length="medium",
+        voice="active",
+        examples=["Café au lait, s'il vous plaît."],
+    )
+
+    loaded = StyleProfile.model_validate_json(profile.model_dump_json().encode("utf-8"))
+
+    assert loaded == profile
+
+
+def test_style_profile_to_view():
+    """Test converting a profile to an immutable view."""
+    profile = StyleProfile(
+        tone="conversational",
+        vocabulary_level="moderate",
+        sentence_structure="short and direct",
+        paragraph_length="medium",
+        voice="active",
+        common_phrases=["in practice"],
+        writing_patterns=["problem-solution"],
+        examples=[f"Example {i}." for i in range(5)],
+    )
+
+    view = profile.to_view()
+
+    assert isinstance(view, StyleProfileView)
+    assert view.tone == "conversational"
+    assert view.common_phrases == ("in practice",)
+    assert view.to_prompt_text() == profile.to_prompt_text()
+    assert not hasattr(view, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        view.tone = "formal"  # type: ignore[misc]
+
+    profile.common_phrases.append("for example")
+    assert view.common_phrases == ("in practice",)